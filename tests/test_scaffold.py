@@ -0,0 +1,79 @@
+import json
+from pathlib import Path
+from typing import List
+
+import pytest
+
+import scaffold
+
+
+def test_frontend_tsconfig_is_valid_json() -> None:
+    # Kept as hand-formatted bytes to avoid importing json on every run.
+    data = json.loads(scaffold._FRONTEND_TSCONFIG)
+    assert {"name": "next"} in data["compilerOptions"]["plugins"]
+    assert ".next/types/**/*.ts" in data["include"]
+
+
+def test_parse_args_defaults() -> None:
+    assert scaffold.parse_args([]) == (".", False, False)
+
+
+def test_parse_args_root_separate_value() -> None:
+    assert scaffold.parse_args(["--root", "out", "--force"]) == ("out", True, False)
+
+
+def test_parse_args_root_equals_value() -> None:
+    assert scaffold.parse_args(["--root=-out", "--prod"]) == ("-out", False, True)
+
+
+def test_parse_args_repeated_mode_is_allowed() -> None:
+    assert scaffold.parse_args(["--dev", "--dev"]) == (".", False, False)
+
+
+@pytest.mark.parametrize(
+    "argv, message",
+    [
+        (["--root"], "argument --root: expected one argument"),
+        (["--root", "--force"], "argument --root: expected one argument"),
+        (["--root", "-x"], "argument --root: expected one argument"),
+        (["--dev", "--prod"], "argument --prod: not allowed with argument --dev"),
+        (["--bogus"], "unrecognized arguments: --bogus"),
+    ],
+)
+def test_parse_args_usage_errors(
+    argv: List[str], message: str, capsys: pytest.CaptureFixture[str]
+) -> None:
+    with pytest.raises(SystemExit) as exc:
+        scaffold.parse_args(argv)
+    assert exc.value.code == 2
+    err = capsys.readouterr().err
+    assert err.startswith("usage: scaffold.py")
+    assert f"scaffold.py: error: {message}\n" in err
+
+
+@pytest.mark.parametrize("flag", ["-h", "--help"])
+def test_parse_args_help(flag: str, capsys: pytest.CaptureFixture[str]) -> None:
+    with pytest.raises(SystemExit) as exc:
+        scaffold.parse_args([flag, "--bogus"])
+    assert exc.value.code == 0
+    assert capsys.readouterr().out == scaffold._USAGE
+
+
+def test_write_file_creates_missing_file(tmp_path: Path) -> None:
+    target = tmp_path / "new.txt"
+    assert scaffold.write_file(str(target), b"content", force=False) is True
+    assert target.read_bytes() == b"content"
+
+
+def test_write_file_skips_existing_file_without_force(tmp_path: Path) -> None:
+    target = tmp_path / "existing.txt"
+    target.write_bytes(b"user edits")
+    assert scaffold.write_file(str(target), b"template", force=False) is False
+    assert target.read_bytes() == b"user edits"
+
+
+def test_write_file_overwrites_existing_file_with_force(tmp_path: Path) -> None:
+    target = tmp_path / "existing.txt"
+    target.write_bytes(b"a much longer file body")
+    assert scaffold.write_file(str(target), b"template", force=True) is True
+    assert target.read_bytes() == b"template"